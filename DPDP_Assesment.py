@@ -3,8 +3,22 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
+import re
 import json
+import os
+import time
+import uuid
+import queue
+import html
+import string
+import atexit
+import hashlib
+import sqlite3
+import difflib
+import threading
 from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, as_completed, wait
 
 # Set page config
 st.set_page_config(
@@ -29,6 +43,8 @@ if 'organization_name' not in st.session_state:
     st.session_state.organization_name = ""
 if 'assessment_date' not in st.session_state:
     st.session_state.assessment_date = datetime.now().strftime("%Y-%m-%d")
+if 'assessment_id' not in st.session_state:
+    st.session_state.assessment_id = uuid.uuid4().hex
 
 # Define sections and questions (directly from our questionnaire)
 sections = [
@@ -325,8 +341,6 @@ recommendations = {
         "Basic procedures exist": "Enhance procedures for handling data subject requests",
         "No formal procedures": "Establish formal procedures for data subject access requests",
         "Yes, but manual process": "Develop more automated export functionality",
-        "Limited capability": "Improve capability to provide data in structured formats",
-        "No capability": "Implement systems to export data in structured formats",
         "Basic process exists": "Enhance processes for correcting inaccurate data",
         "Ad hoc handling": "Formalize processes for handling correction requests",
         "No process": "Establish processes for correcting personal data upon request",
@@ -366,7 +380,6 @@ recommendations = {
     # Data Protection Impact Assessments
     "Data Protection Impact Assessments": {
         "Occasionally": "Conduct DPIAs systematically for all high-risk processing",
-        "Rarely or never": "Implement DPIA framework for high-risk processing activities",
         "Sometimes": "Ensure DPIA results are consistently incorporated into designs",
         "Rarely or never": "Create processes to incorporate DPIA findings into system design"
     },
@@ -381,15 +394,1204 @@ recommendations = {
     }
 }
 
+# Some answers repeat across questions of the same section but call for different
+# actions; these per-question entries take precedence over the section-level ones
+question_recommendations = {
+    ("s4_q1", "Limited capability"): "Improve capability to provide data in structured formats",
+    ("s4_q1", "No capability"): "Implement systems to export data in structured formats",
+    ("s8_q0", "Rarely or never"): "Implement DPIA framework for high-risk processing activities"
+}
+
+def recommendation_for(section_name, question_key, response):
+    recommendation = question_recommendations.get((question_key, response))
+    if recommendation is None:
+        recommendation = recommendations.get(section_name, {}).get(response)
+    return recommendation
+
+# Conditional questions: a follow-up is only asked when its controlling
+# question (always an earlier question) was given one of the listed answers.
+# Follow-ups that are not reached resolve to "Not applicable".
+question_dependencies = {
+    # Cross-Border Data Transfers: safeguards and records only matter if data leaves India
+    "s7_q1": {"depends_on": "s7_q0", "answers": ["Yes, regularly", "Occasionally"]},
+    "s7_q2": {"depends_on": "s7_q0", "answers": ["Yes, regularly", "Occasionally"]}
+}
+
+# A controlling question only decides whether its follow-ups apply, so it is not
+# scored itself; a section whose follow-ups are all skipped is then Not applicable
+unscored_questions = sorted({rule["depends_on"] for rule in question_dependencies.values()})
+
+# Question keys in the order they are asked
+question_order = [
+    f"s{i}_q{j}"
+    for i, section in enumerate(sections)
+    for j in range(len(section["questions"]))
+]
+
+# Dependencies must point backwards so the graph is acyclic and resolves in one pass
+_question_position = {key: position for position, key in enumerate(question_order)}
+for _key, _rule in question_dependencies.items():
+    if _key not in _question_position or _rule["depends_on"] not in _question_position:
+        raise ValueError(f"Unknown question in dependency {_key} -> {_rule['depends_on']}")
+    if _question_position[_rule["depends_on"]] >= _question_position[_key]:
+        raise ValueError(f"Question {_key} must come after {_rule['depends_on']}")
+
+# Whether a question is asked, given the (resolved) answers to earlier questions
+def is_question_reachable(question_key, resolved):
+    rule = question_dependencies.get(question_key)
+    if rule is None:
+        return True
+    return resolved.get(rule["depends_on"]) in rule["answers"]
+
+# Walk the questions in order, keeping answers to reachable questions and
+# auto-resolving unreachable follow-ups. Answers to hidden follow-ups are
+# never read, so stale answers are ignored until the follow-up is reachable again.
+def resolve_responses(responses):
+    resolved = {}
+    for question_key in question_order:
+        if not is_question_reachable(question_key, resolved):
+            resolved[question_key] = "Not applicable"
+        elif question_key in responses:
+            resolved[question_key] = responses[question_key]
+    return resolved
+
+# Compact integer coding of answers: one byte per question in question_order,
+# holding the index of the chosen option (UNANSWERED_CODE if there is none)
+UNANSWERED_CODE = 255
+question_options = [
+    options
+    for section in sections
+    for options in section["options"]
+]
+_option_codes = [{option: code for code, option in enumerate(options)} for options in question_options]
+
+def encode_responses(responses):
+    return bytes(
+        _option_codes[position].get(responses.get(question_key), UNANSWERED_CODE)
+        for position, question_key in enumerate(question_order)
+    )
+
+def decode_responses(codes):
+    return {
+        question_key: question_options[position][code]
+        for position, (question_key, code) in enumerate(zip(question_order, codes))
+        if code != UNANSWERED_CODE
+    }
+
+# Answer codes (bytes for one assessment, or an array for many) as an (n, n_questions) uint8 array
+def codes_array(codes):
+    if isinstance(codes, (bytes, bytearray, memoryview)):
+        codes = np.frombuffer(codes, dtype=np.uint8)
+    return np.asarray(codes, dtype=np.uint8).reshape(-1, len(question_order))
+
+# Vectorized scoring over arrays of answer codes
+# points[q, code] holds answer_points for each option (NaN for Not applicable/unanswered
+# and for every answer to an unscored question)
+def build_scoring_arrays(sections, answer_points, unscored_questions=()):
+    options = [opts for section in sections for opts in section["options"]]
+    keys = [f"s{i}_q{j}" for i, section in enumerate(sections) for j in range(len(section["options"]))]
+    points = np.full((len(options), 256), np.nan)
+    for position, opts in enumerate(options):
+        if keys[position] in unscored_questions:
+            continue
+        for code, option in enumerate(opts):
+            value = answer_points.get(option)
+            if value is not None:
+                points[position, code] = value
+    section_of_question = np.array([i for i, section in enumerate(sections) for _ in section["questions"]])
+    return {
+        "points": points,
+        "section_of_question": section_of_question,
+        "section_matrix": np.eye(len(sections))[section_of_question],
+        "weights": np.array([section["weight"] for section in sections])
+    }
+
+scoring_arrays = build_scoring_arrays(sections, answer_points, unscored_questions)
+
+# Dependencies as (follow-up position, controller position, allowed answer codes), in question order
+_dependency_codes = [
+    (
+        _question_position[question_key],
+        _question_position[rule["depends_on"]],
+        np.array([_option_codes[_question_position[rule["depends_on"]]][answer] for answer in rule["answers"]])
+    )
+    for question_key in question_order
+    if (rule := question_dependencies.get(question_key)) is not None
+]
+
+# Vectorized equivalent of resolve_responses(): which questions each assessment reaches
+def reachable_mask(codes):
+    reachable = np.ones(codes.shape, dtype=bool)
+    for position, controller, allowed in _dependency_codes:
+        reachable[:, position] = reachable[:, controller] & np.isin(codes[:, controller], allowed)
+    return reachable
+
+# Per-question points, applicability and per-section averages for an (n, n_questions) code array
+def score_codes(codes, arrays=None):
+    arrays = arrays or scoring_arrays
+    codes = codes_array(codes)
+    points = arrays["points"][np.arange(codes.shape[1]), codes]
+    points[~reachable_mask(codes)] = np.nan
+    applicable = ~np.isnan(points)
+    counts = applicable @ arrays["section_matrix"]
+    totals = np.where(applicable, points, 0.0) @ arrays["section_matrix"]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        section_scores = np.where(counts > 0, totals / counts, np.nan)
+    return points, applicable, counts, section_scores
+
+# Weighted overall score (%) from per-section averages (NaN for sections with no applicable questions)
+def overall_from_section_scores(section_scores, weights):
+    applicable = ~np.isnan(section_scores)
+    weight_sum = applicable @ weights
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(
+            weight_sum > 0, 100 * np.where(applicable, section_scores, 0.0) @ weights / weight_sum, 0.0
+        )
+
+# Vectorized compliance levels (same thresholds as calculate_compliance_score)
+def compliance_levels(overall):
+    return np.select(
+        [overall >= 90, overall >= 75, overall >= 50],
+        ["High Compliance", "Substantial Compliance", "Partial Compliance"],
+        "Low Compliance"
+    )
+
+# Overall scores plus each question's share of the gap to 100%.
+# A question q in section s costs 100 * w_s / W * (1 - points_q) / n_s, where W is the sum
+# of applicable section weights and n_s the applicable questions in s; the costs of all
+# questions add up exactly to 100 - overall score.
+def score_attribution(codes, arrays=None):
+    arrays = arrays or scoring_arrays
+    points, applicable, counts, section_scores = score_codes(codes, arrays)
+    weights = arrays["weights"]
+    weight_sum = (counts > 0) @ weights
+    q_section = arrays["section_of_question"]
+    overall = overall_from_section_scores(section_scores, weights)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        contributions = np.where(
+            applicable,
+            100 * weights[q_section] * (1 - points) / (weight_sum[:, None] * counts[:, q_section]),
+            0.0
+        )
+    return overall, contributions
+
+# Short labels for charts, e.g. "Security Measures Q4"
+question_labels = [
+    f"{section['name']} Q{j + 1}"
+    for section in sections
+    for j in range(len(section["questions"]))
+]
+question_texts = [question for section in sections for question in section["questions"]]
+
+# Waterfall from 100% down to the overall score, one step per costliest question
+def attribution_waterfall(contributions, top_n=8):
+    order = [i for i in np.argsort(contributions)[::-1][:top_n] if contributions[i] > 0]
+    other = contributions.sum() - contributions[order].sum()
+    labels = ["Full Compliance"] + [question_labels[i] for i in order]
+    values = [100.0] + [-contributions[i] for i in order]
+    hover = ["Maximum possible score"] + [question_texts[i] for i in order]
+    if other > 1e-9:
+        labels.append("Other Questions")
+        values.append(-other)
+        hover.append("All remaining questions")
+    labels.append("Overall Score")
+    values.append(0.0)
+    hover.append("Weighted overall compliance score")
+    fig = go.Figure(go.Waterfall(
+        orientation="v",
+        measure=["absolute"] + ["relative"] * (len(labels) - 2) + ["total"],
+        x=labels,
+        y=values,
+        hovertext=hover,
+        texttemplate="%{y:.1f}",
+        decreasing={"marker": {"color": "red"}},
+        totals={"marker": {"color": "darkblue"}}
+    ))
+    fig.update_layout(height=450, yaxis={"range": [0, 105], "title": "Score (%)"}, showlegend=False)
+    return fig
+
+# Audit log settings
+AUDIT_LOG_PATH = os.environ.get("DPDP_AUDIT_LOG", "dpdp_audit.log")
+GENESIS_HASH = "0" * 64
+
+class AuditLogError(Exception):
+    pass
+
+# Append-only, hash-chained audit log.
+# Each line is "<hash> <prev_hash> <payload>" where hash = sha256(prev_hash + payload),
+# so editing, removing or reordering any earlier line breaks the chain.
+# Events are queued and written by a single writer thread that drains everything
+# pending and issues one fsync per batch (group commit).
+class AuditLog:
+    def __init__(self, path, max_batch=4096):
+        self.path = path
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._last_hash, self._seq = self._recover_tail()
+        self._file = open(path, "ab")
+        self._failure = None
+        self._writer_thread = threading.Thread(target=self._writer, name="audit-log-writer", daemon=True)
+        self._writer_thread.start()
+        # Events still queued when the process exits would otherwise be lost with the daemon thread
+        atexit.register(self.flush, timeout=10)
+
+    def _recover_tail(self):
+        # Read only the end of the file to find the last hash and sequence number
+        if not os.path.exists(self.path):
+            return GENESIS_HASH, 0
+        with open(self.path, "r+b") as f:
+            end = f.seek(0, os.SEEK_END)
+            data = b""
+            pos = end
+            while pos > 0 and data.count(b"\n") < 2:
+                step = min(65536, pos)
+                pos -= step
+                f.seek(pos)
+                data = f.read(step) + data
+            # Drop a torn record left behind by a crash mid-write
+            if data and not data.endswith(b"\n"):
+                cut = data.rfind(b"\n") + 1
+                f.truncate(pos + cut)
+                data = data[:cut]
+            lines = data.rstrip(b"\n").split(b"\n")
+        last = lines[-1] if lines else b""
+        if not last:
+            return GENESIS_HASH, 0
+        return last[:64].decode(), json.loads(last[130:])["seq"]
+
+    def _raise_pending_failure(self):
+        # A failed write of an event nobody waited for is reported to the next caller
+        failure, self._failure = self._failure, None
+        if failure is not None:
+            raise AuditLogError(f"An earlier audit event could not be written: {failure}") from failure
+
+    def _wait(self, done, timeout=None):
+        if not done.wait(timeout):
+            raise AuditLogError("Timed out waiting for the audit log writer")
+        if done.error is not None:
+            raise AuditLogError(f"Audit event could not be written: {done.error}") from done.error
+
+    def record(self, event, organization=None, details=None, wait=False):
+        # Non-blocking by default; pass wait=True to block until the event is on disk.
+        # The event is always queued first; AuditLogError is then raised if this event
+        # (when waiting) or an earlier one failed.
+        done = None
+        if wait:
+            done = threading.Event()
+            done.error = None
+        self._queue.put((time.time(), event, organization, details or {}, done))
+        if done is not None:
+            self._wait(done)
+        self._raise_pending_failure()
+
+    def flush(self, timeout=None):
+        # Block until everything queued so far has been fsynced
+        done = threading.Event()
+        done.error = None
+        self._queue.put((None, None, None, None, done))
+        self._wait(done, timeout)
+        self._raise_pending_failure()
+
+    def _writer(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            # The chain only advances once the batch is safely on disk
+            seq, last_hash = self._seq, self._last_hash
+            lines = []
+            written = []
+            for timestamp, event, organization, details, done in batch:
+                if event is None:
+                    written.append(done)
+                    continue
+                try:
+                    payload = json.dumps({
+                        "seq": seq + 1,
+                        "ts": datetime.fromtimestamp(timestamp).isoformat(timespec="microseconds"),
+                        "event": event,
+                        "organization": organization,
+                        "details": details
+                    }, sort_keys=True, separators=(",", ":")).encode()
+                except (TypeError, ValueError) as e:
+                    self._fail(done, e)
+                    continue
+                seq += 1
+                prev_hash = last_hash.encode()
+                last_hash = hashlib.sha256(prev_hash + payload).hexdigest()
+                lines.append(last_hash.encode() + b" " + prev_hash + b" " + payload + b"\n")
+                written.append(done)
+
+            try:
+                if lines:
+                    position = self._file.tell()
+                    try:
+                        self._file.write(b"".join(lines))
+                        self._file.flush()
+                        os.fsync(self._file.fileno())
+                    except OSError:
+                        # Do not leave part of a batch behind the last committed record
+                        self._file.truncate(position)
+                        raise
+                self._seq, self._last_hash = seq, last_hash
+            except Exception as e:
+                for done in written:
+                    self._fail(done, e)
+                continue
+            for done in written:
+                if done is not None:
+                    done.set()
+
+    def _fail(self, done, error):
+        if done is None:
+            self._failure = error
+        else:
+            done.error = error
+            done.set()
+
+# Verify the hash chain of an audit log.
+# Works on raw bytes (no JSON decoding) so large logs verify quickly.
+# Returns (is_valid, records_checked, first_bad_line_number, last_hash).
+def verify_audit_log(path=AUDIT_LOG_PATH):
+    prev_hash = GENESIS_HASH.encode()
+    count = 0
+    if not os.path.exists(path):
+        return True, 0, None, prev_hash.decode()
+
+    sha256 = hashlib.sha256
+    with open(path, "rb", buffering=1 << 20) as f:
+        for line_number, line in enumerate(f, start=1):
+            if (
+                not line.endswith(b"\n")
+                or line[65:129] != prev_hash
+                or sha256(line[65:129] + line[130:-1]).hexdigest().encode() != line[:64]
+            ):
+                return False, count, line_number, prev_hash.decode()
+            prev_hash = line[:64]
+            count += 1
+    return True, count, None, prev_hash.decode()
+
+# One audit log writer per server process (survives Streamlit reruns)
+@st.cache_resource
+def get_audit_log():
+    return AuditLog(AUDIT_LOG_PATH)
+
+# Record an event from a page: audit failures are shown to the user instead of
+# interrupting work that has already been done
+def record_audit_event(event, organization=None, details=None, wait=False):
+    try:
+        get_audit_log().record(event, organization, details, wait=wait)
+    except AuditLogError as e:
+        st.error(f"Audit log: {e}")
+
+def audit_event(event, details=None, wait=False):
+    details = dict(details or {})
+    details["assessment_id"] = st.session_state.assessment_id
+    details["assessment_date"] = st.session_state.assessment_date
+    record_audit_event(event, st.session_state.organization_name, details, wait=wait)
+
+# Scoring model versioning
+# A scoring model is the section weights, answer_points and the unscored (controlling)
+# questions; its version is a content hash, so any change by legal to these produces a
+# new version whose results are computed alongside the old ones and then switched to atomically.
+def current_scoring_model():
+    return {
+        "weights": [section["weight"] for section in sections],
+        "answer_points": answer_points,
+        "unscored_questions": unscored_questions
+    }
+
+def scoring_model_version(model):
+    return hashlib.sha256(json.dumps(model, sort_keys=True).encode()).hexdigest()[:12]
+
+def scoring_model_arrays(model):
+    return build_scoring_arrays(
+        [dict(section, weight=weight) for section, weight in zip(sections, model["weights"])],
+        model["answer_points"],
+        model.get("unscored_questions", [])
+    )
+
+# What changed between two models: (question, answer code) pairs whose points differ
+# and the sections whose weight differs
+def scoring_model_changes(old_arrays, new_arrays):
+    old_points, new_points = old_arrays["points"], new_arrays["points"]
+    changed = (old_points != new_points) & ~(np.isnan(old_points) & np.isnan(new_points))
+    changed_pairs = np.argwhere(changed)
+    changed_weights = np.flatnonzero(old_arrays["weights"] != new_arrays["weights"])
+    return changed_pairs, changed_weights
+
+# Assessment store settings
+ASSESSMENT_DB_PATH = os.environ.get("DPDP_ASSESSMENT_DB", "dpdp_assessments.db")
+
+# Build a safe FTS5 query from free text: quoted phrases stay phrases,
+# every other word becomes a prefix term, and all terms must match.
+def build_search_query(text):
+    terms = []
+    for phrase, word in re.findall(r'"([^"]+)"|(\S+)', text):
+        if phrase:
+            words = re.findall(r"\w+", phrase)
+            if words:
+                terms.append('"' + " ".join(words) + '"')
+        else:
+            terms.extend(f'"{w}"*' for w in re.findall(r"\w+", word))
+    return " ".join(terms)
+
+# Near-duplicate detection settings (MinHash + LSH over coded answers)
+MINHASH_PERMUTATIONS = 128
+LSH_BANDS = 16
+LSH_ROWS = MINHASH_PERMUTATIONS // LSH_BANDS
+DUPLICATE_THRESHOLD = 0.8
+# A pair with similarity s shares at least one bucket with probability
+# 1 - (1 - s**LSH_ROWS)**LSH_BANDS: about 82% at 0.75 but only 61% at 0.7, so lower
+# thresholds are not offered
+DUPLICATE_MIN_THRESHOLD = 0.75
+# Buckets up to this size are verified pair by pair; larger ones against one
+# representative per cluster found so far
+DUPLICATE_ALL_PAIRS_SIZE = 32
+MAX_OPTIONS = 8
+
+# One random 32-bit value per (permutation, question, answer) token; the minimum
+# over an assessment's tokens is its MinHash value for that permutation
+_minhash_table = np.random.default_rng(20240811).integers(
+    0, 2**32 - 1, size=(MINHASH_PERMUTATIONS, len(question_order) * MAX_OPTIONS), dtype=np.uint32
+)
+
+# MinHash signatures for a (n_assessments, n_questions) array of answer codes
+def minhash_signatures(codes):
+    codes = codes_array(codes)
+    answered = codes != UNANSWERED_CODE
+    tokens = np.arange(len(question_order)) * MAX_OPTIONS + np.where(answered, codes, 0)
+    signatures = np.empty((len(codes), MINHASH_PERMUTATIONS), dtype=np.uint32)
+    for start in range(0, len(codes), 4096):
+        values = _minhash_table[:, tokens[start:start + 4096]]
+        values[:, ~answered[start:start + 4096]] = np.iinfo(np.uint32).max
+        signatures[start:start + 4096] = values.min(axis=2).T
+    return signatures
+
+# Split a signature into LSH bands and hash each band to a signed 64-bit bucket id
+def lsh_buckets(signature):
+    return [
+        (band, int.from_bytes(
+            hashlib.blake2b(signature[band * LSH_ROWS:(band + 1) * LSH_ROWS].tobytes(), digest_size=8).digest(),
+            "big", signed=True
+        ))
+        for band in range(LSH_BANDS)
+    ]
+
+# Exact Jaccard similarity of two assessments' (question, answer) sets
+def answer_similarity(codes_a, codes_b):
+    a = np.frombuffer(codes_a, dtype=np.uint8)
+    b = np.frombuffer(codes_b, dtype=np.uint8)
+    answered_a = a != UNANSWERED_CODE
+    answered_b = b != UNANSWERED_CODE
+    shared = np.count_nonzero((a == b) & answered_a)
+    union = np.count_nonzero(answered_a) + np.count_nonzero(answered_b) - shared
+    return float(shared / union) if union else 0.0
+
+# SQLite-backed store of completed assessments.
+# Findings (one row per question that produced a recommendation) are indexed
+# incrementally in an FTS5 inverted index as each assessment is saved, and the
+# static recommendations catalog gets its own small index.
+class AssessmentStore:
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS assessments (
+                id INTEGER PRIMARY KEY,
+                assessment_uid TEXT UNIQUE NOT NULL,
+                organization TEXT NOT NULL,
+                assessment_date TEXT NOT NULL,
+                completed_at TEXT NOT NULL,
+                overall_score REAL NOT NULL,
+                compliance_level TEXT NOT NULL,
+                responses TEXT NOT NULL,
+                answer_codes BLOB
+            );
+            CREATE TABLE IF NOT EXISTS findings (
+                id INTEGER PRIMARY KEY,
+                assessment_id INTEGER NOT NULL REFERENCES assessments(id) ON DELETE CASCADE,
+                section TEXT NOT NULL,
+                question_key TEXT NOT NULL,
+                response TEXT NOT NULL,
+                recommendation TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS findings_assessment ON findings(assessment_id);
+            CREATE VIRTUAL TABLE IF NOT EXISTS findings_fts USING fts5(
+                recommendation, section, response,
+                content='findings', content_rowid='id', tokenize='porter unicode61'
+            );
+            CREATE TRIGGER IF NOT EXISTS findings_ai AFTER INSERT ON findings BEGIN
+                INSERT INTO findings_fts(rowid, recommendation, section, response)
+                VALUES (new.id, new.recommendation, new.section, new.response);
+            END;
+            CREATE TRIGGER IF NOT EXISTS findings_ad AFTER DELETE ON findings BEGIN
+                INSERT INTO findings_fts(findings_fts, rowid, recommendation, section, response)
+                VALUES ('delete', old.id, old.recommendation, old.section, old.response);
+            END;
+            CREATE VIRTUAL TABLE IF NOT EXISTS catalog_fts USING fts5(
+                recommendation, section, response, tokenize='porter unicode61'
+            );
+            CREATE TABLE IF NOT EXISTS lsh_buckets (
+                band INTEGER NOT NULL,
+                bucket INTEGER NOT NULL,
+                assessment_id INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS lsh_buckets_bucket ON lsh_buckets(band, bucket);
+            CREATE INDEX IF NOT EXISTS lsh_buckets_assessment ON lsh_buckets(assessment_id);
+            CREATE TABLE IF NOT EXISTS settings (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS scoring_models (
+                version TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS assessment_scores (
+                model_version TEXT NOT NULL,
+                assessment_id INTEGER NOT NULL,
+                overall_score REAL NOT NULL,
+                compliance_level TEXT NOT NULL,
+                section_scores BLOB NOT NULL,
+                PRIMARY KEY (model_version, assessment_id)
+            );
+            CREATE INDEX IF NOT EXISTS assessments_organization ON assessments(organization, id);
+            CREATE INDEX IF NOT EXISTS assessments_completed ON assessments(completed_at, id);
+            CREATE INDEX IF NOT EXISTS assessment_scores_overall ON assessment_scores(model_version, overall_score, assessment_id);
+            CREATE INDEX IF NOT EXISTS findings_section ON findings(section, id);
+        """)
+        self._model_arrays = {}
+        self._migrate()
+        self._index_catalog()
+        self.code_model_version = self.register_scoring_model(current_scoring_model())
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO settings (key, value) VALUES ('active_scoring_model', ?)",
+                (self.code_model_version,)
+            )
+        self._backfill_scores(self.active_model_version())
+
+    def _migrate(self):
+        # Stores created before answers were coded get the column and a backfill
+        with self._lock, self._conn:
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(assessments)")]
+            if "answer_codes" not in columns:
+                self._conn.execute("ALTER TABLE assessments ADD COLUMN answer_codes BLOB")
+            rows = self._conn.execute(
+                "SELECT id, responses FROM assessments WHERE answer_codes IS NULL"
+            ).fetchall()
+            for assessment_id, responses in rows:
+                codes = encode_responses(json.loads(responses))
+                self._conn.execute("UPDATE assessments SET answer_codes = ? WHERE id = ?", (codes, assessment_id))
+                self._index_duplicates(assessment_id, codes)
+
+    def register_scoring_model(self, model):
+        version = scoring_model_version(model)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO scoring_models (version, model, created_at) VALUES (?, ?, ?)",
+                (version, json.dumps(model, sort_keys=True), datetime.now().isoformat(timespec="seconds"))
+            )
+        return version
+
+    def active_model_version(self):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT value FROM settings WHERE key = 'active_scoring_model'"
+            ).fetchone()[0]
+
+    def scoring_model(self, version):
+        with self._lock:
+            model = self._conn.execute(
+                "SELECT model FROM scoring_models WHERE version = ?", (version,)
+            ).fetchone()[0]
+        return json.loads(model)
+
+    def model_arrays(self, version):
+        if version not in self._model_arrays:
+            self._model_arrays[version] = scoring_model_arrays(self.scoring_model(version))
+        return self._model_arrays[version]
+
+    def _score_rows(self, version, assessment_ids, codes):
+        _, _, _, section_scores = score_codes(codes, self.model_arrays(version))
+        overall = overall_from_section_scores(section_scores, self.model_arrays(version)["weights"])
+        return [
+            (version, int(assessment_id), float(score), str(level), row.tobytes())
+            for assessment_id, score, level, row in zip(assessment_ids, overall, compliance_levels(overall), section_scores)
+        ]
+
+    def _write_scores(self, rows):
+        # Caller holds the lock and the transaction
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO assessment_scores "
+            "(model_version, assessment_id, overall_score, compliance_level, section_scores) VALUES (?, ?, ?, ?, ?)",
+            rows
+        )
+
+    def _backfill_scores(self, version, chunk_size=50000):
+        # Score any assessment that has no results under the given model yet, in id order
+        # a keyset chunk at a time
+        last_id = -1
+        while True:
+            with self._lock:
+                rows = self._conn.execute("""
+                    SELECT a.id, a.answer_codes FROM assessments a
+                    WHERE a.id > ? AND NOT EXISTS (
+                        SELECT 1 FROM assessment_scores s WHERE s.model_version = ? AND s.assessment_id = a.id
+                    )
+                    ORDER BY a.id LIMIT ?
+                """, (last_id, version, chunk_size)).fetchall()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            score_rows = self._score_rows(version, [row[0] for row in rows], b"".join(row[1] for row in rows))
+            with self._lock, self._conn:
+                self._write_scores(score_rows)
+
+    def _index_duplicates(self, assessment_id, codes):
+        # Caller holds the lock and the transaction
+        signature = minhash_signatures(codes)[0]
+        self._conn.execute("DELETE FROM lsh_buckets WHERE assessment_id = ?", (assessment_id,))
+        self._conn.executemany(
+            "INSERT INTO lsh_buckets (band, bucket, assessment_id) VALUES (?, ?, ?)",
+            [(band, bucket, assessment_id) for band, bucket in lsh_buckets(signature)]
+        )
+
+    def _index_catalog(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM catalog_fts")
+            self._conn.executemany(
+                "INSERT INTO catalog_fts(recommendation, section, response) VALUES (?, ?, ?)",
+                sorted({
+                    (recommendation_for(section["name"], f"s{i}_q{j}", option), section["name"], option)
+                    for i, section in enumerate(sections)
+                    for j, options in enumerate(section["options"])
+                    for option in options
+                    if recommendation_for(section["name"], f"s{i}_q{j}", option) is not None
+                })
+            )
+
+    def save_assessment(self, assessment_uid, organization, assessment_date, responses, results):
+        codes = encode_responses(responses)
+        findings = []
+        for i, section in enumerate(sections):
+            for j in range(len(section["questions"])):
+                question_key = f"s{i}_q{j}"
+                response = responses.get(question_key)
+                score = answer_points.get(response)
+                recommendation = recommendation_for(section["name"], question_key, response)
+                if score is not None and score < 1.0 and recommendation is not None:
+                    findings.append((section["name"], question_key, response, recommendation))
+
+        with self._lock, self._conn:
+            # Re-completing an assessment replaces its previous findings
+            self._conn.execute(
+                "DELETE FROM findings WHERE assessment_id = "
+                "(SELECT id FROM assessments WHERE assessment_uid = ?)",
+                (assessment_uid,)
+            )
+            self._conn.execute("""
+                INSERT INTO assessments (assessment_uid, organization, assessment_date, completed_at,
+                                         overall_score, compliance_level, responses, answer_codes)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(assessment_uid) DO UPDATE SET
+                    organization = excluded.organization,
+                    assessment_date = excluded.assessment_date,
+                    completed_at = excluded.completed_at,
+                    overall_score = excluded.overall_score,
+                    compliance_level = excluded.compliance_level,
+                    responses = excluded.responses,
+                    answer_codes = excluded.answer_codes
+            """, (
+                assessment_uid, organization, assessment_date, datetime.now().isoformat(timespec="seconds"),
+                results["overall_score"], results["compliance_level"], json.dumps(responses), codes
+            ))
+            assessment_id = self._conn.execute(
+                "SELECT id FROM assessments WHERE assessment_uid = ?", (assessment_uid,)
+            ).fetchone()[0]
+            self._conn.executemany(
+                "INSERT INTO findings (assessment_id, section, question_key, response, recommendation) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(assessment_id,) + finding for finding in findings]
+            )
+            self._index_duplicates(assessment_id, codes)
+            # Results under the model used by this code and under the active model (if different)
+            for version in {self.code_model_version, self._conn.execute(
+                "SELECT value FROM settings WHERE key = 'active_scoring_model'"
+            ).fetchone()[0]}:
+                self._write_scores(self._score_rows(version, [assessment_id], codes))
+        return assessment_id
+
+    # Rescore stored assessments under a new scoring model and switch to it.
+    # Only (question, answer) pairs whose points changed mark an assessment as affected,
+    # and only the sections containing them are recomputed from the stored answer codes;
+    # a weight change only recomputes overall scores from the stored section scores.
+    # Unaffected results are copied inside SQLite. Readers keep seeing the old version
+    # until the final single-row switch. Results left over from an earlier time the new
+    # version was active may predate re-completed assessments, so they are discarded first.
+    def rescore(self, new_model, chunk_size=50000, progress=None):
+        old_version = self.active_model_version()
+        new_version = self.register_scoring_model(new_model)
+        if new_version == old_version:
+            return {"version": new_version, "rescored": 0, "copied": 0}
+
+        old_arrays = self.model_arrays(old_version)
+        new_arrays = self.model_arrays(new_version)
+        changed_pairs, changed_weights = scoring_model_changes(old_arrays, new_arrays)
+        affected_sections = np.unique(new_arrays["section_of_question"][changed_pairs[:, 0]])
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM assessment_scores WHERE model_version = ?", (new_version,))
+            total = self._conn.execute(
+                "SELECT count(*) FROM assessment_scores WHERE model_version = ?", (old_version,)
+            ).fetchone()[0]
+
+        rescored = 0
+        processed = 0
+        last_id = -1
+        while True:
+            with self._lock:
+                rows = self._conn.execute("""
+                    SELECT s.assessment_id, a.answer_codes, s.section_scores
+                    FROM assessment_scores s JOIN assessments a ON a.id = s.assessment_id
+                    WHERE s.model_version = ? AND s.assessment_id > ?
+                    ORDER BY s.assessment_id LIMIT ?
+                """, (old_version, last_id, chunk_size)).fetchall()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            processed += len(rows)
+
+            assessment_ids = np.array([row[0] for row in rows])
+            codes = codes_array(b"".join(row[1] for row in rows))
+            section_scores = np.frombuffer(b"".join(row[2] for row in rows), dtype=np.float64)
+            section_scores = section_scores.reshape(len(rows), len(sections)).copy()
+
+            # Assessments that reached a question with a changed answer value
+            affected = np.zeros(len(rows), dtype=bool)
+            if len(changed_pairs):
+                reachable = reachable_mask(codes)
+                for question, code in changed_pairs:
+                    affected |= (codes[:, question] == code) & reachable[:, question]
+                if affected.any():
+                    _, _, _, new_section_scores = score_codes(codes[affected], new_arrays)
+                    section_scores[np.ix_(affected, affected_sections)] = new_section_scores[:, affected_sections]
+
+            # Weight changes move every overall score; otherwise only affected rows change
+            update = np.ones(len(rows), dtype=bool) if len(changed_weights) else affected
+            if update.any():
+                overall = overall_from_section_scores(section_scores[update], new_arrays["weights"])
+                score_rows = [
+                    (new_version, int(assessment_id), float(score), str(level), row.tobytes())
+                    for assessment_id, score, level, row in zip(
+                        assessment_ids[update], overall, compliance_levels(overall), section_scores[update]
+                    )
+                ]
+                with self._lock, self._conn:
+                    self._write_scores(score_rows)
+                rescored += len(score_rows)
+            if progress:
+                progress(processed, total)
+
+        with self._lock, self._conn:
+            copied = self._conn.execute("""
+                INSERT OR IGNORE INTO assessment_scores
+                    (model_version, assessment_id, overall_score, compliance_level, section_scores)
+                SELECT ?, assessment_id, overall_score, compliance_level, section_scores
+                FROM assessment_scores WHERE model_version = ?
+            """, (new_version, old_version)).rowcount
+            self._conn.execute(
+                "UPDATE settings SET value = ? WHERE key = 'active_scoring_model'", (new_version,)
+            )
+        return {"version": new_version, "rescored": rescored, "copied": copied}
+
+    def answer_code_matrix(self):
+        # Every stored assessment as (organizations, (n, n_questions) uint8 code array)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT organization, answer_codes FROM assessments ORDER BY id"
+            ).fetchall()
+        organizations = [organization for organization, _ in rows]
+        codes = np.frombuffer(b"".join(codes for _, codes in rows), dtype=np.uint8)
+        return organizations, codes.reshape(len(rows), len(question_order))
+
+    # Keyset pagination: each page is fetched with "WHERE (sort_value, id) > cursor ... LIMIT n"
+    # on an index, so cost and memory depend on the page size, not on how many rows exist.
+    # Returns (rows, next_cursor); next_cursor is None on the last page.
+    assessment_sort_columns = {
+        "Completed": "a.completed_at",
+        "Organization": "a.organization",
+        "Overall Score": "s.overall_score"
+    }
+
+    def list_assessments(self, sort="Completed", descending=True, organization_prefix="",
+                         compliance_level=None, cursor=None, limit=25):
+        column = self.assessment_sort_columns[sort]
+        # The tie-breaking id comes from the same table as the sort column so that
+        # both are read from one index in order
+        id_column = "s.assessment_id" if column.startswith("s.") else "a.id"
+        where = ["s.model_version = (SELECT value FROM settings WHERE key = 'active_scoring_model')"]
+        params = []
+        if organization_prefix:
+            where.append("a.organization >= ? AND a.organization < ?")
+            params += [organization_prefix, organization_prefix + "\U0010ffff"]
+        if compliance_level:
+            where.append("s.compliance_level = ?")
+            params.append(compliance_level)
+        if cursor is not None:
+            where.append(f"({column}, {id_column}) {'<' if descending else '>'} (?, ?)")
+            params += list(cursor)
+        order = "DESC" if descending else "ASC"
+        # CROSS JOIN fixes the join order so SQLite walks the index of the sorted table
+        tables = (
+            "assessment_scores s CROSS JOIN assessments a" if column.startswith("s.")
+            else "assessments a CROSS JOIN assessment_scores s"
+        )
+        with self._lock:
+            rows = self._conn.execute(f"""
+                SELECT a.id, a.organization, a.assessment_date, a.completed_at,
+                       s.overall_score, s.compliance_level, {column}
+                FROM {tables} ON s.assessment_id = a.id
+                WHERE {' AND '.join(where)}
+                ORDER BY {column} {order}, {id_column} {order}
+                LIMIT ?
+            """, params + [limit + 1]).fetchall()
+        next_cursor = (rows[limit - 1][6], rows[limit - 1][0]) if len(rows) > limit else None
+        return [
+            {
+                "Assessment": assessment_id,
+                "Organization": organization,
+                "Assessment Date": assessment_date,
+                "Completed": completed_at,
+                "Overall Score (%)": round(overall_score, 1),
+                "Compliance Level": level
+            }
+            for assessment_id, organization, assessment_date, completed_at, overall_score, level, _ in rows[:limit]
+        ], next_cursor
+
+    # Findings are keyed on these columns, outermost first. Sorting by organization walks
+    # assessments on (organization, id) and each assessment's findings on (assessment_id, id).
+    finding_sort_columns = {
+        "Recorded": ["f.id"],
+        "Section": ["f.section", "f.id"],
+        "Organization": ["a.organization", "a.id", "f.id"]
+    }
+
+    def list_findings(self, sort="Recorded", descending=True, section=None, cursor=None, limit=25):
+        columns = self.finding_sort_columns[sort]
+        op = "<" if descending else ">"
+        order = "DESC" if descending else "ASC"
+        # CROSS JOIN fixes the join order so SQLite walks the index of the sorted table
+        tables = (
+            "assessments a CROSS JOIN findings f ON f.assessment_id = a.id" if columns[0].startswith("a.")
+            else "findings f CROSS JOIN assessments a ON a.id = f.assessment_id"
+        )
+        keys = [f"k{position}" for position in range(len(columns))]
+
+        # SQLite only bounds an index range on the first column of a row value (and never on
+        # a rowid tie-breaker), so "after the cursor" is split into one branch per column:
+        # equal on the columns before it and past the cursor on it. Each branch reads an
+        # index range of at most limit + 1 rows.
+        branches = [([], [])] if cursor is None else [
+            ([f"{column} = ?" for column in columns[:position]] + [f"{columns[position]} {op} ?"],
+             list(cursor[:position + 1]))
+            for position in reversed(range(len(columns)))
+        ]
+        queries = []
+        params = []
+        for conditions, values in branches:
+            if section:
+                # When walking assessments, "+" keeps the section filter from choosing
+                # findings_section over each assessment's own findings
+                section_condition = "+f.section = ?" if columns[0].startswith("a.") else "f.section = ?"
+                conditions = [section_condition] + conditions
+                values = [section] + values
+            queries.append(f"""
+                SELECT * FROM (
+                    SELECT f.id, a.organization, a.assessment_date, f.section, f.question_key, f.response,
+                           f.recommendation, {', '.join(f'{column} AS {key}' for column, key in zip(columns, keys))}
+                    FROM {tables}
+                    {'WHERE ' + ' AND '.join(conditions) if conditions else ''}
+                    ORDER BY {', '.join(f'{column} {order}' for column in columns)}
+                    LIMIT ?
+                )""")
+            params += values + [limit + 1]
+        with self._lock:
+            rows = self._conn.execute(
+                " UNION ALL ".join(queries) + f" ORDER BY {', '.join(f'{key} {order}' for key in keys)} LIMIT ?",
+                params + [limit + 1]
+            ).fetchall()
+        next_cursor = tuple(rows[limit - 1][7:]) if len(rows) > limit else None
+        return [
+            {
+                "Organization": organization,
+                "Assessment Date": assessment_date,
+                "Section": section_name,
+                "Question": question_key,
+                "Answer": response,
+                "Recommendation": recommendation
+            }
+            for _, organization, assessment_date, section_name, question_key, response, recommendation, *_ in rows[:limit]
+        ], next_cursor
+
+    def latest_assessments(self):
+        # Most recent assessment per organization (SQLite takes bare columns from the max(id) row)
+        with self._lock:
+            rows = self._conn.execute("""
+                SELECT a.organization, a.assessment_date, coalesce(s.overall_score, a.overall_score), a.answer_codes
+                FROM (SELECT max(id) AS id FROM assessments GROUP BY organization) latest
+                JOIN assessments a ON a.id = latest.id
+                LEFT JOIN assessment_scores s ON s.assessment_id = a.id
+                    AND s.model_version = (SELECT value FROM settings WHERE key = 'active_scoring_model')
+            """).fetchall()
+        return rows
+
+    def find_duplicate_clusters(self, threshold=DUPLICATE_THRESHOLD):
+        # Assessments sharing an LSH bucket are candidates. Small buckets are checked pair
+        # by pair; in larger ones each member is checked against a representative of every
+        # cluster already found in the bucket and becomes one itself if none matches
+        with self._lock:
+            buckets = self._conn.execute("""
+                SELECT group_concat(assessment_id) FROM lsh_buckets
+                GROUP BY band, bucket HAVING count(*) > 1
+            """).fetchall()
+        buckets = [[int(assessment_id) for assessment_id in members.split(",")] for (members,) in buckets]
+        candidate_ids = sorted({assessment_id for members in buckets for assessment_id in members})
+        if not candidate_ids:
+            return []
+
+        info = {}
+        with self._lock:
+            for start in range(0, len(candidate_ids), 500):
+                chunk = candidate_ids[start:start + 500]
+                rows = self._conn.execute(
+                    "SELECT id, organization, assessment_date, answer_codes FROM assessments "
+                    f"WHERE id IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                for assessment_id, organization, assessment_date, codes in rows:
+                    info[assessment_id] = (organization, assessment_date, codes)
+
+        # Union-find over verified pairs
+        parent = {}
+
+        def find(x):
+            parent.setdefault(x, x)
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        similarity = {}
+        for members in buckets:
+            # group_concat order is unspecified; sorting keeps the result deterministic
+            members = sorted(members)
+            all_pairs = len(members) <= DUPLICATE_ALL_PAIRS_SIZE
+            representatives = []
+            for member in members:
+                matched = False
+                for representative in representatives:
+                    if find(representative) == find(member):
+                        matched = True
+                        continue
+                    score = answer_similarity(info[representative][2], info[member][2])
+                    if score >= threshold:
+                        parent[find(member)] = find(representative)
+                        similarity[member] = max(similarity.get(member, 0.0), score)
+                        similarity[representative] = max(similarity.get(representative, 0.0), score)
+                        matched = True
+                if all_pairs or not matched:
+                    representatives.append(member)
+
+        clusters = {}
+        for assessment_id in parent:
+            clusters.setdefault(find(assessment_id), []).append(assessment_id)
+        return sorted(
+            (
+                [
+                    {
+                        "Assessment": assessment_id,
+                        "Organization": info[assessment_id][0],
+                        "Assessment Date": info[assessment_id][1],
+                        "Similarity": similarity.get(assessment_id, 1.0)
+                    }
+                    for assessment_id in sorted(members)
+                ]
+                for members in clusters.values() if len(members) > 1
+            ),
+            key=len, reverse=True
+        )
+
+    def search_findings(self, text, organization=None, limit=50):
+        query = build_search_query(text)
+        if not query:
+            return []
+        sql = """
+            SELECT a.organization, a.assessment_date, f.section, f.question_key,
+                   f.recommendation, bm25(findings_fts) AS rank
+            FROM findings_fts
+            JOIN findings f ON f.id = findings_fts.rowid
+            JOIN assessments a ON a.id = f.assessment_id
+            WHERE findings_fts MATCH ?
+        """
+        params = [query]
+        if organization:
+            sql += " AND a.organization = ?"
+            params.append(organization)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            {
+                "Organization": organization_name,
+                "Assessment Date": assessment_date,
+                "Section": section_name,
+                "Question": question_key,
+                "Recommendation": recommendation,
+                "Relevance": -rank
+            }
+            for organization_name, assessment_date, section_name, question_key, recommendation, rank in rows
+        ]
+
+    def search_catalog(self, text, limit=20):
+        query = build_search_query(text)
+        if not query:
+            return []
+        with self._lock:
+            rows = self._conn.execute("""
+                SELECT section, response, recommendation, bm25(catalog_fts) AS rank
+                FROM catalog_fts WHERE catalog_fts MATCH ? ORDER BY rank LIMIT ?
+            """, (query, limit)).fetchall()
+        return [
+            {"Section": section_name, "Answer": response, "Recommendation": recommendation}
+            for section_name, response, recommendation, _ in rows
+        ]
+
+# One store connection per server process (survives Streamlit reruns)
+@st.cache_resource
+def get_assessment_store():
+    return AssessmentStore(ASSESSMENT_DB_PATH)
+
+# Estimated effort (person-weeks) to implement each recommendation
+DEFAULT_EFFORT = 3
+recommendation_effort = {
+    # Consent Management
+    "Implement clearer consent mechanisms with explicit opt-in options": 3,
+    "Replace implicit consent with explicit consent mechanisms": 4,
+    "Simplify consent language and avoid technical jargon": 1,
+    "Rewrite consent notices in plain, simple language": 2,
+    "Separate consent for different data processing purposes": 3,
+    "Implement granular consent options for different processing activities": 5,
+    "Simplify the consent withdrawal process": 2,
+    "Make consent withdrawal options easily accessible": 3,
+    # Purpose Limitation
+    "Document all purposes for personal data processing": 2,
+    "Create a comprehensive data processing register": 4,
+    "Implement stricter controls to prevent purpose creep": 3,
+    "Establish clear purpose limitation policy and controls": 4,
+    "Strengthen controls to prevent data use beyond stated purposes": 3,
+    "Implement technical and policy controls for purpose limitation": 5,
+    # Data Minimization
+    "Review data collection processes to minimize data collected": 2,
+    "Conduct a data inventory and eliminate unnecessary collection": 4,
+    "Implement regular data minimization reviews": 1,
+    "Establish a systematic process for identifying redundant data": 3,
+    # Data Retention
+    "Develop a comprehensive data retention policy": 2,
+    "Create and implement a formal data retention policy": 3,
+    "Define specific retention periods for each data category": 2,
+    "Establish clear retention periods for all data categories": 3,
+    "Enhance automation of data deletion processes": 4,
+    "Implement semi-automated data deletion processes": 6,
+    "Establish a systematic process for data deletion after retention periods": 4,
+    # Data Subject Rights
+    "Enhance procedures for handling data subject requests": 2,
+    "Establish formal procedures for data subject access requests": 3,
+    "Develop more automated export functionality": 5,
+    "Improve capability to provide data in structured formats": 4,
+    "Implement systems to export data in structured formats": 6,
+    "Enhance processes for correcting inaccurate data": 1,
+    "Formalize processes for handling correction requests": 2,
+    "Establish processes for correcting personal data upon request": 3,
+    "Extend deletion capabilities to all systems": 6,
+    "Improve data erasure capabilities across systems": 5,
+    "Implement mechanisms for complete data erasure": 8,
+    # Security Measures
+    "Enhance security measures with encryption and access controls": 4,
+    "Implement comprehensive security based on ISO 27001": 8,
+    "Establish regular security assessment schedule": 1,
+    "Implement regular security assessments of data processing systems": 3,
+    "Implement role-based access with least privilege principle": 4,
+    "Develop comprehensive access control framework": 6,
+    "Implement full encryption for data at rest and in transit": 5,
+    "Establish encryption standards for all personal data": 6,
+    # Data Breach Management
+    "Develop and test a comprehensive breach response plan": 3,
+    "Create and implement a formal data breach response plan": 4,
+    "Enhance breach detection systems": 4,
+    "Implement monitoring systems for timely breach detection": 6,
+    "Enhance procedures for authority notifications": 1,
+    "Establish procedures for timely breach notifications": 2,
+    "Improve documentation processes for breaches": 1,
+    "Implement comprehensive breach documentation system": 3,
+    # Cross-Border Data Transfers
+    "Enhance protection measures for cross-border transfers": 3,
+    "Implement adequate safeguards for international transfers": 5,
+    "Improve record-keeping for cross-border transfers": 1,
+    "Establish comprehensive records of all data transfers": 3,
+    # Data Protection Impact Assessments
+    "Conduct DPIAs systematically for all high-risk processing": 3,
+    "Implement DPIA framework for high-risk processing activities": 4,
+    "Ensure DPIA results are consistently incorporated into designs": 2,
+    "Create processes to incorporate DPIA findings into system design": 3,
+    # DPO and Governance
+    "Consider dedicated DPO role based on processing volume": 2,
+    "Designate a Data Protection Officer or equivalent role": 2,
+    "Enhance data protection training program": 2,
+    "Implement regular data protection training for all staff": 3,
+    "Establish regular compliance audit schedule": 1,
+    "Implement regular compliance audits": 3
+}
+
+# Generic guidance shown alongside recommendations for some sections
+additional_guidance = {
+    "Consent Management": [
+        "Review and update all consent forms and notices",
+        "Test consent mechanisms with users to ensure clarity",
+        "Document your consent processes and justifications"
+    ],
+    "Data Breach Management": [
+        "Create a dedicated breach response team with clear roles",
+        "Conduct regular breach simulation exercises",
+        "Document all breach notification templates and procedures"
+    ]
+}
+
 # Function to calculate compliance scores
-def calculate_compliance_score():
+# (defaults to the current session's responses)
+def calculate_compliance_score(responses=None, model=None):
     section_scores = {}
     section_recommendations = {}
+    if responses is None:
+        responses = st.session_state.responses
+    responses = resolve_responses(responses)
+    # Section weights and answer points of the scoring model (this release's by default)
+    model = model or current_scoring_model()
+    section_weights = {section["name"]: weight for section, weight in zip(sections, model["weights"])}
+    unscored = set(model.get("unscored_questions", []))
     
     # Calculate scores for each section
     for i, section in enumerate(sections):
         section_name = section["name"]
-        section_weight = section["weight"]
+        section_weight = section_weights[section_name]
         section_score = 0
         applicable_questions = 0
         section_recommendations[section_name] = []
@@ -398,9 +1600,9 @@ def calculate_compliance_score():
         for j, question in enumerate(section["questions"]):
             question_key = f"s{i}_q{j}"
             
-            if question_key in st.session_state.responses:
-                response = st.session_state.responses[question_key]
-                score = answer_points.get(response)
+            if question_key in responses and question_key not in unscored:
+                response = responses[question_key]
+                score = model["answer_points"].get(response)
                 
                 # Skip N/A responses
                 if score is None:
@@ -411,10 +1613,9 @@ def calculate_compliance_score():
                 
                 # Generate recommendation if score < 1
                 if score < 1.0:
-                    if response in recommendations.get(section_name, {}):
-                        section_recommendations[section_name].append(
-                            recommendations[section_name][response]
-                        )
+                    recommendation = recommendation_for(section_name, question_key, response)
+                    if recommendation is not None:
+                        section_recommendations[section_name].append(recommendation)
         
         # Calculate average score for the section
         if applicable_questions > 0:
@@ -428,7 +1629,7 @@ def calculate_compliance_score():
     
     for section_name, score in section_scores.items():
         if score is not None:
-            section_weight = next((s["weight"] for s in sections if s["name"] == section_name), 0)
+            section_weight = section_weights.get(section_name, 0)
             total_weighted_score += score * section_weight
             applicable_weight_sum += section_weight
     
@@ -459,23 +1660,586 @@ def calculate_compliance_score():
         "overall_score": overall_score,
         "compliance_level": compliance_level,
         "section_scores": section_scores,
+        "section_weights": section_weights,
         "high_risk_areas": high_risk_areas,
         "recommendations": section_recommendations,
         "improvement_priorities": high_risk_areas[:3]  # Top 3 areas to focus on
     }
 
+# Report content shared by the report page and the HTML export
+def section_score_rows(results):
+    section_data = []
+    for section in sections:
+        section_name = section["name"]
+        if section_name in results["section_scores"] and results["section_scores"][section_name] is not None:
+            score = results["section_scores"][section_name] * 100
+            section_data.append({
+                "Section": section_name,
+                "Score (%)": f"{score:.1f}%",
+                "Weight": f"{results['section_weights'][section_name] * 100:.1f}%",
+                "Status": "High Risk" if score < 60 else ("Moderate Risk" if score < 75 else "Compliant")
+            })
+    return section_data
+
+def report_strengths(results):
+    return [
+        section for section, score in results["section_scores"].items()
+        if score is not None and score >= 0.75
+    ]
+
+# Questionnaire workbook ingestion
+# Vendors return the questionnaire as an .xlsx sheet with a header row containing
+# "Question" and "Answer" columns (and optionally a "Key" column with s{i}_q{j} ids).
+# "Organization" and "Assessment Date" label/value rows may appear above the header.
+def normalize_text(text):
+    return " ".join(re.findall(r"[a-z0-9]+", str(text).lower()))
+
+# Precomputed lookups from normalized text onto the exact questionnaire wording
+question_text_lookup = {
+    normalize_text(question): f"s{i}_q{j}"
+    for i, section in enumerate(sections)
+    for j, question in enumerate(section["questions"])
+}
+answer_option_lookup = {
+    f"s{i}_q{j}": {normalize_text(option): option for option in options}
+    for i, section in enumerate(sections)
+    for j, options in enumerate(section["options"])
+}
+answer_aliases = {"na": "Not applicable", "n a": "Not applicable", "not applicable": "Not applicable"}
+
+@lru_cache(maxsize=65536)
+def match_answer(question_key, text):
+    normalized = normalize_text(text)
+    options = answer_option_lookup[question_key]
+    if normalized in options:
+        return options[normalized]
+    if normalized in answer_aliases and "Not applicable" in options.values():
+        return answer_aliases[normalized]
+    close = difflib.get_close_matches(normalized, list(options), n=1, cutoff=0.85)
+    return options[close[0]] if close else None
+
+@lru_cache(maxsize=4096)
+def match_question(text):
+    normalized = normalize_text(text)
+    if normalized in question_text_lookup:
+        return question_text_lookup[normalized]
+    close = difflib.get_close_matches(normalized, list(question_text_lookup), n=1, cutoff=0.9)
+    return question_text_lookup[close[0]] if close else None
+
+# Answers are scored under the given scoring model (this release's by default)
+def ingest_workbook(path, model=None):
+    from openpyxl import load_workbook
+
+    organization = os.path.splitext(os.path.basename(path))[0]
+    assessment_date = datetime.now().strftime("%Y-%m-%d")
+    workbook_date = None
+    responses = {}
+    rejects = []
+    unmatched = set()
+
+    def reject(row, question, answer, reason):
+        rejects.append({"File": os.path.basename(path), "Row": row, "Question": question,
+                        "Answer": answer, "Reason": reason})
+
+    try:
+        workbook = load_workbook(path, read_only=True, data_only=True)
+    except Exception as e:
+        reject(None, None, None, f"Could not open workbook: {e}")
+        return {"file": path, "organization": organization, "assessment_date": assessment_date,
+                "assessment_uid": None, "responses": responses, "results": None, "rejects": rejects}
+
+    try:
+        for worksheet in workbook.worksheets:
+            columns = None
+            for row_number, row in enumerate(worksheet.iter_rows(values_only=True), start=1):
+                cells = [normalize_text(value) if value is not None else "" for value in row]
+                if columns is None:
+                    values = [value for value in row if value not in (None, "")]
+                    label = cells[0] if cells else ""
+                    if label in ("organization", "organization name", "organisation", "organisation name", "vendor") and len(values) > 1:
+                        organization = str(values[1]).strip()
+                    elif label == "assessment date" and len(values) > 1:
+                        date_value = values[1]
+                        assessment_date = date_value.strftime("%Y-%m-%d") if hasattr(date_value, "strftime") else str(date_value).strip()
+                        workbook_date = assessment_date
+                    elif "question" in cells and ("answer" in cells or "response" in cells):
+                        columns = {
+                            "question": cells.index("question"),
+                            "answer": cells.index("answer") if "answer" in cells else cells.index("response"),
+                            "key": cells.index("key") if "key" in cells else None
+                        }
+                    continue
+
+                def cell(index):
+                    return row[index] if index is not None and index < len(row) else None
+
+                question_text, answer_text, key_text = cell(columns["question"]), cell(columns["answer"]), cell(columns["key"])
+                # Rows without an answer (section headings, skipped questions) are left to
+                # the missing-answer check below
+                if answer_text is None or not str(answer_text).strip():
+                    continue
+
+                question_key = str(key_text).strip() if key_text and str(key_text).strip() in answer_option_lookup else None
+                if question_key is None and question_text not in (None, ""):
+                    question_key = match_question(str(question_text))
+                if question_key is None:
+                    reject(row_number, question_text, answer_text, "Unrecognized question")
+                    continue
+
+                answer = match_answer(question_key, str(answer_text))
+                if answer is None:
+                    reject(row_number, question_text, answer_text, f"Answer does not match any option for {question_key}")
+                    unmatched.add(question_key)
+                    continue
+                responses[question_key] = answer
+    finally:
+        workbook.close()
+
+    # Every question that is reachable from the given answers must be answered
+    resolved = resolve_responses(responses)
+    for question_key in question_order:
+        if question_key not in resolved and question_key not in unmatched:
+            i, j = (int(part[1:]) for part in question_key.split("_"))
+            reject(None, sections[i]["questions"][j], None, f"Missing answer for {question_key}")
+
+    # Re-importing a questionnaire replaces the earlier import: it is identified by the
+    # organization and the workbook's own date, or by its answers when it has no date
+    if workbook_date is not None:
+        assessment_uid = f"import:{organization}:{workbook_date}"
+    else:
+        assessment_uid = "import:" + hashlib.sha256(
+            json.dumps([organization, resolved], sort_keys=True).encode()
+        ).hexdigest()
+
+    return {
+        "file": path,
+        "organization": organization,
+        "assessment_date": assessment_date,
+        "assessment_uid": assessment_uid,
+        "responses": resolved,
+        "results": calculate_compliance_score(responses, model) if responses else None,
+        "rejects": rejects
+    }
+
+# Ingest every .xlsx workbook in a folder across a process pool.
+# At most max_in_flight workbooks are queued at a time so memory stays bounded;
+# results are yielded as they finish (not in file order).
+def ingest_folder(folder, model=None, max_workers=None, max_in_flight=None):
+    paths = (
+        os.path.join(folder, name)
+        for name in sorted(os.listdir(folder))
+        if name.lower().endswith(".xlsx") and not name.startswith("~$")
+    )
+    max_workers = max_workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or max_workers * 2
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        for path in paths:
+            pending.add(executor.submit(ingest_workbook, path, model))
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in as_completed(pending):
+            yield future.result()
+
+# Remediation planning
+# Lookup tables by (question position, answer code): the recommendation for that answer
+# and its effort (0 where there is no recommended action). Questions that control
+# follow-ups are never planned, so every action's gain stays independent of the others.
+remediation_actions = [
+    [recommendation_for(section["name"], f"s{i}_q{j}", option) for option in options]
+    for i, section in enumerate(sections)
+    for j, options in enumerate(section["options"])
+]
+effort_table = np.zeros((len(question_order), 256), dtype=np.int64)
+for _position, _actions in enumerate(remediation_actions):
+    for _code, _action in enumerate(_actions):
+        if _action is not None:
+            effort_table[_position, _code] = recommendation_effort.get(_action, DEFAULT_EFFORT)
+_controller_questions = np.zeros(len(question_order), dtype=bool)
+_controller_questions[[controller for _, controller, _ in _dependency_codes]] = True
+
+# Choose the recommended actions that maximize overall score gain within an effort budget.
+# Raising one applicable answer to its 1.0 option gains exactly its attribution
+# contribution, and these gains add up, so an exact 0/1 knapsack over integer efforts
+# applies. The DP runs vectorized over assessments (rows) and budgets (columns).
+# Returns (selected, gains, efforts), each shaped (n, n_questions).
+def plan_remediation(codes, budget, arrays=None, chunk_size=4096):
+    codes = codes_array(codes)
+    _, gains = score_attribution(codes, arrays)
+    efforts = effort_table[np.arange(codes.shape[1]), codes]
+    candidates = (gains > 1e-12) & (efforts > 0) & ~_controller_questions
+    gains = np.where(candidates, gains, 0.0)
+    selected = np.zeros(codes.shape, dtype=bool)
+    budget = int(budget)
+
+    for start in range(0, len(codes), chunk_size):
+        chunk_gains = gains[start:start + chunk_size]
+        chunk_efforts = efforts[start:start + chunk_size]
+        chunk_candidates = candidates[start:start + chunk_size]
+        rows_in_chunk = len(chunk_gains)
+        best = np.zeros((rows_in_chunk, budget + 1))
+        take = np.zeros((codes.shape[1], rows_in_chunk, budget + 1), dtype=bool)
+
+        for question in range(codes.shape[1]):
+            question_efforts = chunk_efforts[:, question]
+            for effort in np.unique(question_efforts[chunk_candidates[:, question]]):
+                if effort > budget:
+                    continue
+                rows = np.flatnonzero(chunk_candidates[:, question] & (question_efforts == effort))
+                with_action = best[rows, :budget + 1 - effort] + chunk_gains[rows, question][:, None]
+                improves = with_action > best[rows, effort:] + 1e-12
+                best[rows, effort:] = np.where(improves, with_action, best[rows, effort:])
+                take[question, rows[:, None], np.arange(effort, budget + 1)[None, :]] = improves
+
+        # Walk back through the questions to recover the chosen actions
+        remaining = np.full(rows_in_chunk, budget)
+        row_index = np.arange(rows_in_chunk)
+        for question in reversed(range(codes.shape[1])):
+            chosen = take[question, row_index, remaining]
+            selected[start + row_index[chosen], question] = True
+            remaining = remaining - np.where(chosen, chunk_efforts[:, question], 0)
+
+    return selected, gains, efforts
+
+# One assessment's plan as display rows, best return on effort first
+def remediation_plan_rows(codes, selected, gains, efforts):
+    codes = codes_array(codes)[0]
+    rows = [
+        {
+            "Section": sections[scoring_arrays["section_of_question"][question]]["name"],
+            "Question": question_labels[question],
+            "Action": remediation_actions[question][codes[question]],
+            "Effort (person-weeks)": int(efforts[question]),
+            "Score Gain": float(gains[question])
+        }
+        for question in np.flatnonzero(selected)
+    ]
+    return sorted(rows, key=lambda row: row["Score Gain"] / row["Effort (person-weeks)"], reverse=True)
+
+# Plan every organization's latest assessment within the budget, a chunk at a time,
+# keeping only the per-organization totals. Largest score gain first.
+def portfolio_remediation(latest, budget, arrays=None, chunk_size=4096):
+    organizations = list(latest)
+    frames = []
+    for start in range(0, len(organizations), chunk_size):
+        chunk = organizations[start:start + chunk_size]
+        codes = codes_array(b"".join(latest[organization] for organization in chunk))
+        selected, gains, efforts = plan_remediation(codes, budget, arrays, chunk_size)
+        current, _ = score_attribution(codes, arrays)
+        frames.append(pd.DataFrame({
+            "Organization": chunk,
+            "Current Score": current,
+            "Projected Score": current + (selected * gains).sum(axis=1),
+            "Effort (person-weeks)": (selected * efforts).sum(axis=1),
+            "Actions": selected.sum(axis=1)
+        }))
+    if not frames:
+        return pd.DataFrame(columns=["Organization", "Current Score", "Projected Score",
+                                     "Effort (person-weeks)", "Actions", "Score Gain"])
+    plans = pd.concat(frames, ignore_index=True)
+    plans["Score Gain"] = plans["Projected Score"] - plans["Current Score"]
+    return plans.sort_values(["Score Gain", "Organization"], ascending=[False, True]).reset_index(drop=True)
+
+# Rank questions by the points they cost across every stored assessment
+def portfolio_attribution(store, chunk_size=100000):
+    arrays = store.model_arrays(store.active_model_version())
+    _, codes = store.answer_code_matrix()
+    total_lost = np.zeros(len(question_order))
+    losing = np.zeros(len(question_order), dtype=np.int64)
+    for start in range(0, len(codes), chunk_size):
+        _, contributions = score_attribution(codes[start:start + chunk_size], arrays)
+        total_lost += contributions.sum(axis=0)
+        losing += (contributions > 0).sum(axis=0)
+
+    df = pd.DataFrame({
+        "Question": question_labels,
+        "Text": question_texts,
+        "Avg Points Lost": total_lost / max(len(codes), 1),
+        "Total Points Lost": total_lost,
+        "Assessments Losing Points": losing
+    })
+    return df.sort_values("Total Points Lost", ascending=False).reset_index(drop=True)
+
+# Static HTML report settings
+REPORT_OUTPUT_DIR = os.environ.get("DPDP_REPORT_DIR", "reports")
+REPORT_MANIFEST = "manifest.json"
+
+# Templates are compiled once at import and reused for every report
+report_page_template = string.Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>DPDP Compliance Report - $organization</title>
+<style>
+body { font-family: -apple-system, "Segoe UI", Roboto, sans-serif; max-width: 960px; margin: 2rem auto; padding: 0 1rem; color: #222; }
+h1 { margin-bottom: 0; }
+table { border-collapse: collapse; width: 100%; margin: 1rem 0; }
+th, td { border-bottom: 1px solid #ddd; padding: 0.4rem 0.6rem; text-align: left; }
+.score { font-size: 1.6rem; font-weight: bold; }
+.strength { color: #1b5e20; }
+.risk { color: #b71c1c; }
+details { border: 1px solid #ddd; border-radius: 4px; padding: 0.5rem 1rem; margin: 0.5rem 0; }
+summary { font-weight: bold; cursor: pointer; }
+</style>
+</head>
+<body>
+<h1>DPDP Compliance Report</h1>
+<h2>For: $organization</h2>
+<p>Assessment Date: $assessment_date</p>
+<p class="score">Overall Compliance: $overall_score% - $compliance_level</p>
+<p>This report provides a detailed assessment of your organization's compliance with the DPDP Act
+across ten key areas. Review the section scores and recommendations below to identify areas
+for improvement.</p>
+<h3>Section Compliance Scores</h3>
+<table>
+<tr><th>Section</th><th>Score (%)</th><th>Weight</th><th>Status</th></tr>
+$section_rows
+</table>
+$chart
+<h3>Key Findings</h3>
+$key_findings
+<h3>Detailed Recommendations</h3>
+$recommendation_sections
+<h3>Priority Action Plan</h3>
+<p>Focus on these areas first to significantly improve your compliance:</p>
+$priority_plan
+</body>
+</html>
+""")
+report_index_template = string.Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>DPDP Compliance Reports</title>
+<style>
+body { font-family: -apple-system, "Segoe UI", Roboto, sans-serif; max-width: 960px; margin: 2rem auto; padding: 0 1rem; }
+table { border-collapse: collapse; width: 100%; }
+th, td { border-bottom: 1px solid #ddd; padding: 0.4rem 0.6rem; text-align: left; }
+</style>
+</head>
+<body>
+<h1>DPDP Compliance Reports</h1>
+<table>
+<tr><th>Organization</th><th>Assessment Date</th><th>Overall Compliance</th></tr>
+$rows
+</table>
+</body>
+</html>
+""")
+
+# Bump whenever the report rendering code changes (render_report_html, the SVG chart,
+# section_score_rows, report_strengths) so existing reports are rebuilt
+REPORT_RENDERER_VERSION = 1
+
+# Digest of everything that affects a rendered report besides the answers and the
+# scoring model version themselves
+report_model_digest = hashlib.sha256(json.dumps([
+    REPORT_RENDERER_VERSION, report_page_template.template, sections, recommendations,
+    sorted(question_recommendations.items()), question_dependencies, additional_guidance
+], sort_keys=True).encode()).hexdigest()
+
+def score_color(score):
+    if score < 50:
+        return "red"
+    if score < 75:
+        return "orange"
+    if score < 90:
+        return "lightgreen"
+    return "green"
+
+# Inline SVG version of the section score bar chart (no scripts, no external assets)
+def render_score_chart_svg(results):
+    scored = sorted(
+        ((name, score * 100) for name, score in results["section_scores"].items() if score is not None),
+        key=lambda item: item[1]
+    )
+    label_width, bar_width, row_height = 280, 400, 26
+    height = row_height * len(scored) + 10
+    bars = []
+    for row, (name, score) in enumerate(scored):
+        y = row * row_height + 5
+        bars.append(
+            f'<text x="{label_width - 8}" y="{y + 16}" text-anchor="end" font-size="12">{html.escape(name)}</text>'
+            f'<rect x="{label_width}" y="{y}" width="{bar_width * score / 100:.1f}" height="{row_height - 6}" '
+            f'fill="{score_color(score)}"/>'
+            f'<text x="{label_width + bar_width * score / 100 + 4:.1f}" y="{y + 16}" font-size="12">{score:.1f}%</text>'
+        )
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{label_width + bar_width + 60}" height="{height}" '
+        f'role="img" aria-label="Section compliance scores">{"".join(bars)}</svg>'
+    )
+
+def render_report_html(organization, assessment_date, results):
+    escape = html.escape
+    section_rows = "\n".join(
+        "<tr>" + "".join(f"<td>{escape(row[column])}</td>" for column in ("Section", "Score (%)", "Weight", "Status")) + "</tr>"
+        for row in section_score_rows(results)
+    )
+
+    key_findings = []
+    strengths = report_strengths(results)
+    if strengths:
+        key_findings.append("<p><strong>Strengths:</strong></p><ul>" + "".join(
+            f'<li class="strength">{escape(area)} ({results["section_scores"][area] * 100:.1f}%)</li>'
+            for area in strengths[:3]
+        ) + "</ul>")
+    if results["high_risk_areas"]:
+        key_findings.append("<p><strong>Areas for Improvement:</strong></p><ul>" + "".join(
+            f'<li class="risk">{escape(area)} ({results["section_scores"][area] * 100:.1f}%)</li>'
+            for area in results["high_risk_areas"]
+        ) + "</ul>")
+
+    recommendation_sections = []
+    for section in sections:
+        section_name = section["name"]
+        section_recs = results["recommendations"].get(section_name)
+        if not section_recs:
+            continue
+        body = []
+        score = results["section_scores"].get(section_name)
+        if score is not None:
+            body.append(f"<p>Current compliance score: {score * 100:.1f}%</p>")
+        body.append("<p><strong>Recommended Actions:</strong></p><ul>" + "".join(
+            f"<li>{escape(rec)}</li>" for rec in section_recs
+        ) + "</ul>")
+        if section_name in additional_guidance:
+            body.append("<p><strong>Additional Guidance:</strong></p><ul>" + "".join(
+                f"<li>{escape(item)}</li>" for item in additional_guidance[section_name]
+            ) + "</ul>")
+        recommendation_sections.append(
+            f"<details><summary>{escape(section_name)}</summary>{''.join(body)}</details>"
+        )
+
+    priority_plan = []
+    for i, area in enumerate(results["improvement_priorities"][:3]):
+        priority_plan.append(f"<p><strong>Priority {i + 1}: {escape(area)}</strong></p>")
+        if results["recommendations"].get(area):
+            priority_plan.append("<ul>" + "".join(
+                f"<li>{escape(rec)}</li>" for rec in results["recommendations"][area][:3]
+            ) + "</ul>")
+
+    return report_page_template.substitute(
+        organization=escape(organization),
+        assessment_date=escape(assessment_date),
+        overall_score=f"{results['overall_score']:.1f}",
+        compliance_level=escape(results["compliance_level"]),
+        section_rows=section_rows,
+        chart=render_score_chart_svg(results),
+        key_findings="\n".join(key_findings),
+        recommendation_sections="\n".join(recommendation_sections),
+        priority_plan="\n".join(priority_plan)
+    )
+
+def report_filename(organization):
+    slug = re.sub(r"[^a-z0-9]+", "-", organization.lower()).strip("-") or "report"
+    return f"{slug}-{hashlib.sha1(organization.encode()).hexdigest()[:8]}.html"
+
+def write_file_atomic(path, content):
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(temp_path, path)
+
+# Worker: score (under the given scoring model) and render a chunk of reports,
+# returning (organization, overall_score) pairs
+def render_html_report_chunk(output_dir, model, jobs):
+    rendered = []
+    for organization, assessment_date, codes in jobs:
+        results = calculate_compliance_score(decode_responses(codes), model)
+        write_file_atomic(
+            os.path.join(output_dir, report_filename(organization)),
+            render_report_html(organization, assessment_date, results)
+        )
+        rendered.append((organization, results["overall_score"]))
+    return rendered
+
+# Build one self-contained HTML report per organization (its latest assessment).
+# A manifest of content hashes lets unchanged reports be skipped; changed ones are
+# rendered in chunks across a process pool.
+def build_html_reports(store, output_dir=REPORT_OUTPUT_DIR, max_workers=None, chunk_size=64):
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, REPORT_MANIFEST)
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        manifest = {}
+
+    model_version = store.active_model_version()
+    model = store.scoring_model(model_version)
+    new_manifest = {}
+    jobs = []
+    for organization, assessment_date, overall_score, codes in store.latest_assessments():
+        filename = report_filename(organization)
+        content_hash = hashlib.sha256(
+            report_model_digest.encode() + json.dumps([model_version, organization, assessment_date]).encode() + codes
+        ).hexdigest()
+        new_manifest[filename] = {
+            "organization": organization,
+            "assessment_date": assessment_date,
+            "overall_score": overall_score,
+            "hash": content_hash
+        }
+        previous = manifest.get(filename)
+        if previous and previous["hash"] == content_hash and os.path.exists(os.path.join(output_dir, filename)):
+            new_manifest[filename]["overall_score"] = previous["overall_score"]
+            continue
+        jobs.append((organization, assessment_date, codes))
+
+    if jobs:
+        chunks = [jobs[start:start + chunk_size] for start in range(0, len(jobs), chunk_size)]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(render_html_report_chunk, output_dir, model, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                for organization, overall_score in future.result():
+                    new_manifest[report_filename(organization)]["overall_score"] = overall_score
+
+    # Remove reports for organizations no longer in the store
+    for filename in set(manifest) - set(new_manifest):
+        try:
+            os.remove(os.path.join(output_dir, filename))
+        except FileNotFoundError:
+            pass
+
+    index_rows = "\n".join(
+        f'<tr><td><a href="{filename}">{html.escape(entry["organization"])}</a></td>'
+        f'<td>{html.escape(entry["assessment_date"])}</td><td>{entry["overall_score"]:.1f}%</td></tr>'
+        for filename, entry in sorted(new_manifest.items(), key=lambda item: item[1]["organization"].lower())
+    )
+    write_file_atomic(os.path.join(output_dir, "index.html"), report_index_template.substitute(rows=index_rows))
+    write_file_atomic(manifest_path, json.dumps(new_manifest, indent=1))
+    return {"written": len(jobs), "skipped": len(new_manifest) - len(jobs)}
+
 # Navigation functions
 def go_to_page(page):
     st.session_state.current_page = page
 
+def complete_assessment():
+    st.session_state.assessment_complete = True
+    store = get_assessment_store()
+    st.session_state.results = calculate_compliance_score(model=store.scoring_model(store.active_model_version()))
+    audit_event("assessment_completed", {
+        "overall_score": st.session_state.results["overall_score"],
+        "compliance_level": st.session_state.results["compliance_level"],
+        "responses": resolve_responses(st.session_state.responses)
+    }, wait=True)
+    store.save_assessment(
+        st.session_state.assessment_id,
+        st.session_state.organization_name,
+        st.session_state.assessment_date,
+        resolve_responses(st.session_state.responses),
+        st.session_state.results
+    )
+    go_to_page('report')
+
 def go_to_section(section_idx):
     if section_idx < 0:
         section_idx = 0
     if section_idx >= len(sections):
         # Completed all sections
-        st.session_state.assessment_complete = True
-        st.session_state.results = calculate_compliance_score()
-        go_to_page('report')
+        complete_assessment()
         return
     
     st.session_state.current_section = section_idx
@@ -483,6 +2247,9 @@ def go_to_section(section_idx):
 
 def save_response(section_idx, question_idx, response):
     key = f"s{section_idx}_q{question_idx}"
+    previous = st.session_state.responses.get(key)
+    if previous != response:
+        audit_event("response_changed", {"question": key, "previous": previous, "response": response})
     st.session_state.responses[key] = response
 
 # Application header
@@ -502,6 +2269,7 @@ def render_header():
                 st.session_state.current_section = 0
                 st.session_state.organization_name = ""
                 st.session_state.assessment_date = datetime.now().strftime("%Y-%m-%d")
+                st.session_state.assessment_id = uuid.uuid4().hex
                 go_to_page('welcome')
 
 # Sidebar navigation
@@ -530,6 +2298,30 @@ def render_sidebar():
                 go_to_page('recommendations')
             else:
                 st.sidebar.warning("Complete the assessment first to view recommendations")
+
+        if st.button("All Assessments", use_container_width=True):
+            go_to_page('assessments')
+
+        if st.button("Search Findings", use_container_width=True):
+            go_to_page('search')
+
+        if st.button("Import Questionnaires", use_container_width=True):
+            go_to_page('import')
+
+        if st.button("Duplicate Submissions", use_container_width=True):
+            go_to_page('duplicates')
+
+        if st.button("Portfolio Insights", use_container_width=True):
+            go_to_page('portfolio')
+
+        if st.button("Publish Reports", use_container_width=True):
+            go_to_page('publish')
+
+        if st.button("Scoring Model", use_container_width=True):
+            go_to_page('scoring_model')
+
+        if st.button("Audit Log", use_container_width=True):
+            go_to_page('audit_log')
         
         st.divider()
         if st.session_state.organization_name:
@@ -667,9 +2459,7 @@ def render_dashboard():
 # Assessment page (continued)
 def render_assessment():
     if st.session_state.current_section >= len(sections):
-        st.session_state.assessment_complete = True
-        st.session_state.results = calculate_compliance_score()
-        go_to_page('report')
+        complete_assessment()
         return
     
     section = sections[st.session_state.current_section]
@@ -679,13 +2469,21 @@ def render_assessment():
     progress = st.session_state.current_section / len(sections)
     st.progress(progress)
     
-    # Display questions
+    # Display only the questions reachable from the answers given so far
+    resolved = resolve_responses(st.session_state.responses)
+    question_number = 0
     for q_idx, question in enumerate(section["questions"]):
-        st.subheader(f"Question {q_idx + 1}")
+        question_key = f"s{st.session_state.current_section}_q{q_idx}"
+        if not is_question_reachable(question_key, resolved):
+            resolved[question_key] = "Not applicable"
+            continue
+        
+        question_number += 1
+        st.subheader(f"Question {question_number}")
         st.write(question)
         
         # Get current response if any
-        current_response = st.session_state.responses.get(f"s{st.session_state.current_section}_q{q_idx}", None)
+        current_response = st.session_state.responses.get(question_key, None)
         
         # Display options as radio buttons
         options = section["options"][q_idx]
@@ -699,6 +2497,9 @@ def render_assessment():
         # Save response when selected
         if response:
             save_response(st.session_state.current_section, q_idx, response)
+            resolved[question_key] = response
+        else:
+            resolved.pop(question_key, None)
         
         st.divider()
     
@@ -712,11 +2513,11 @@ def render_assessment():
     
     with col3:
         if st.button("Next Section", type="primary"):
-            # Check if all questions in current section are answered
+            # Check if all reachable questions in current section are answered
             all_answered = True
             for q_idx in range(len(section["questions"])):
                 key = f"s{st.session_state.current_section}_q{q_idx}"
-                if key not in st.session_state.responses:
+                if key not in resolved:
                     all_answered = False
             
             if all_answered:
@@ -754,29 +2555,14 @@ def render_report():
     st.subheader("Section Compliance Scores")
     
     # Create dataframe for section scores
-    section_data = []
-    for section in sections:
-        section_name = section["name"]
-        if section_name in results["section_scores"] and results["section_scores"][section_name] is not None:
-            score = results["section_scores"][section_name] * 100
-            section_data.append({
-                "Section": section_name,
-                "Score (%)": f"{score:.1f}%",
-                "Weight": f"{section['weight'] * 100:.1f}%",
-                "Status": "High Risk" if score < 60 else ("Moderate Risk" if score < 75 else "Compliant")
-            })
-    
-    df = pd.DataFrame(section_data)
+    df = pd.DataFrame(section_score_rows(results))
     st.dataframe(df, use_container_width=True)
     
     # Key findings
     st.subheader("Key Findings")
     
     # Strengths
-    strengths = [
-        section for section, score in results["section_scores"].items() 
-        if score is not None and score >= 0.75
-    ]
+    strengths = report_strengths(results)
     
     if strengths:
         st.write("**Strengths:**")
@@ -791,15 +2577,33 @@ def render_report():
             score = results["section_scores"][area] * 100
             st.error(f"• {area} ({score:.1f}%)")
     
+    # Score attribution
+    st.subheader("Score Attribution")
+    st.write("How much each question reduces the overall score from a maximum of 100%:")
+    store = get_assessment_store()
+    arrays = store.model_arrays(store.active_model_version())
+    _, contributions = score_attribution(encode_responses(st.session_state.responses), arrays)
+    st.plotly_chart(attribution_waterfall(contributions[0]), use_container_width=True)
+    
     # Export options
     st.subheader("Export Report")
-    col1, col2 = st.columns(2)
+    col1, col2, col3 = st.columns(3)
     with col1:
         if st.button("Export as PDF"):
+            audit_event("report_exported", {"format": "pdf"}, wait=True)
             st.info("PDF export functionality would be implemented here.")
     with col2:
         if st.button("Export as CSV"):
+            audit_event("report_exported", {"format": "csv"}, wait=True)
             st.info("CSV export functionality would be implemented here.")
+    with col3:
+        if st.download_button(
+            "Export as HTML",
+            render_report_html(st.session_state.organization_name, st.session_state.assessment_date, results),
+            file_name=report_filename(st.session_state.organization_name),
+            mime="text/html"
+        ):
+            audit_event("report_exported", {"format": "html"}, wait=True)
     
     # Navigation buttons
     if st.button("View Detailed Recommendations", type="primary"):
@@ -836,20 +2640,10 @@ def render_recommendations():
                     st.write(f"• {rec}")
                 
                 # Add some generic guidance based on section
-                if section_name == "Consent Management":
-                    st.write("""
-                    **Additional Guidance:**
-                    - Review and update all consent forms and notices
-                    - Test consent mechanisms with users to ensure clarity
-                    - Document your consent processes and justifications
-                    """)
-                elif section_name == "Data Breach Management":
-                    st.write("""
-                    **Additional Guidance:**
-                    - Create a dedicated breach response team with clear roles
-                    - Conduct regular breach simulation exercises
-                    - Document all breach notification templates and procedures
-                    """)
+                if section_name in additional_guidance:
+                    st.write("**Additional Guidance:**\n" + "\n".join(
+                        f"- {item}" for item in additional_guidance[section_name]
+                    ))
     
     # Priority action plan
     st.subheader("Priority Action Plan")
@@ -861,6 +2655,25 @@ def render_recommendations():
             for rec in results["recommendations"][area][:3]:  # Top 3 recommendations
                 st.write(f"• {rec}")
     
+    # Remediation planner
+    st.subheader("Remediation Planner")
+    st.write("The set of recommended actions that raises your overall score the most within an effort budget:")
+    budget = st.slider("Effort budget (person-weeks)", min_value=1, max_value=60, value=12)
+    store = get_assessment_store()
+    codes = encode_responses(st.session_state.responses)
+    selected, gains, efforts = plan_remediation(codes, budget, store.model_arrays(store.active_model_version()))
+    plan = remediation_plan_rows(codes, selected[0], gains[0], efforts[0])
+    if plan:
+        total_gain = sum(row["Score Gain"] for row in plan)
+        total_effort = sum(row["Effort (person-weeks)"] for row in plan)
+        st.write(f"**Projected score:** {results['overall_score']:.1f}% → {results['overall_score'] + total_gain:.1f}% "
+                 f"using {total_effort} of {budget} person-weeks")
+        df = pd.DataFrame(plan)
+        df["Score Gain"] = df["Score Gain"].map(lambda x: f"+{x:.1f}")
+        st.dataframe(df, use_container_width=True)
+    else:
+        st.write("No recommended action fits within this budget.")
+    
     # Resources
     st.subheader("Helpful Resources")
     st.write("""
@@ -870,6 +2683,290 @@ def render_recommendations():
     - [Contact a DPDP Compliance Expert](mailto:info@dpdpcompliance.com)
     """)
 
+# Keyset pagination state: a stack of cursors per list, reset when its filters change
+def page_state(list_key, filters):
+    state = st.session_state.setdefault(f"pages_{list_key}", {"filters": None, "cursors": [None]})
+    if state["filters"] != filters:
+        state["filters"] = filters
+        state["cursors"] = [None]
+    return state
+
+def render_page_controls(list_key, state, next_cursor):
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col1:
+        if len(state["cursors"]) > 1 and st.button("Previous Page", key=f"prev_{list_key}"):
+            state["cursors"].pop()
+            st.rerun()
+    with col2:
+        st.write(f"Page {len(state['cursors'])}")
+    with col3:
+        if next_cursor is not None and st.button("Next Page", key=f"next_{list_key}"):
+            state["cursors"].append(next_cursor)
+            st.rerun()
+
+# Assessment and findings lists (only the visible page is loaded)
+def render_assessment_list():
+    st.header("All Assessments")
+    store = get_assessment_store()
+    assessments_tab, findings_tab = st.tabs(["Assessments", "Findings"])
+
+    with assessments_tab:
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            organization_prefix = st.text_input("Organization starts with")
+        with col2:
+            compliance_level = st.selectbox(
+                "Compliance level",
+                ["All", "High Compliance", "Substantial Compliance", "Partial Compliance", "Low Compliance"]
+            )
+        with col3:
+            sort = st.selectbox("Sort by", list(AssessmentStore.assessment_sort_columns))
+        with col4:
+            descending = st.radio("Order", ["Descending", "Ascending"], horizontal=True) == "Descending"
+        page_size = st.select_slider("Rows per page", options=[10, 25, 50, 100], value=25)
+
+        filters = (organization_prefix, compliance_level, sort, descending, page_size)
+        state = page_state("assessments", filters)
+        rows, next_cursor = store.list_assessments(
+            sort=sort,
+            descending=descending,
+            organization_prefix=organization_prefix,
+            compliance_level=None if compliance_level == "All" else compliance_level,
+            cursor=state["cursors"][-1],
+            limit=page_size
+        )
+        if rows:
+            st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+        else:
+            st.info("No assessments match these filters.")
+        render_page_controls("assessments", state, next_cursor)
+
+    with findings_tab:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            section = st.selectbox("Section", ["All"] + [section["name"] for section in sections])
+        with col2:
+            findings_sort = st.selectbox("Sort by", list(AssessmentStore.finding_sort_columns), key="findings_sort")
+        with col3:
+            findings_descending = st.radio(
+                "Order", ["Descending", "Ascending"], horizontal=True, key="findings_order"
+            ) == "Descending"
+        findings_page_size = st.select_slider("Findings per page", options=[10, 25, 50, 100], value=25)
+        state = page_state("findings", (section, findings_sort, findings_descending, findings_page_size))
+        rows, next_cursor = store.list_findings(
+            sort=findings_sort,
+            descending=findings_descending,
+            section=None if section == "All" else section,
+            cursor=state["cursors"][-1],
+            limit=findings_page_size
+        )
+        if rows:
+            st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+        else:
+            st.info("No findings recorded yet.")
+        render_page_controls("findings", state, next_cursor)
+
+# Search page
+def render_search():
+    st.header("Search Recommendations and Findings")
+    st.write("Search recommendations across all completed assessments. Use quotes for exact phrases.")
+
+    query = st.text_input("Search", placeholder='e.g. "breach notification" or encryption')
+    if not query:
+        return
+
+    store = get_assessment_store()
+
+    st.subheader("Findings Across Assessments")
+    findings = store.search_findings(query)
+    if findings:
+        df = pd.DataFrame(findings)
+        st.dataframe(df.drop(columns=["Relevance"]), use_container_width=True)
+        st.write("**Organizations affected:** " + ", ".join(df["Organization"].unique()))
+    else:
+        st.info("No findings match your search.")
+
+    st.subheader("Recommendation Catalog")
+    catalog = store.search_catalog(query)
+    if catalog:
+        st.dataframe(pd.DataFrame(catalog), use_container_width=True)
+    else:
+        st.info("No catalog recommendations match your search.")
+
+# Questionnaire import page
+def render_import():
+    st.header("Import Vendor Questionnaires")
+    st.write("Score every completed questionnaire workbook (.xlsx) in a folder and add it to the assessment store.")
+
+    folder = st.text_input("Folder containing .xlsx questionnaires")
+    if not st.button("Import", type="primary") or not folder:
+        return
+    if not os.path.isdir(folder):
+        st.error("Folder not found.")
+        return
+
+    store = get_assessment_store()
+    imported = []
+    rejects = []
+    with st.spinner("Importing questionnaires..."):
+        for result in ingest_folder(folder, store.scoring_model(store.active_model_version())):
+            rejects.extend(result["rejects"])
+            if result["results"] is None:
+                continue
+            assessment_uid = result["assessment_uid"]
+            store.save_assessment(assessment_uid, result["organization"], result["assessment_date"],
+                                  result["responses"], result["results"])
+            record_audit_event("assessment_imported", result["organization"], {
+                "assessment_id": assessment_uid,
+                "file": os.path.basename(result["file"]),
+                "overall_score": result["results"]["overall_score"],
+                "rejected_rows": len(result["rejects"])
+            })
+            imported.append({
+                "Organization": result["organization"],
+                "Assessment Date": result["assessment_date"],
+                "Overall Score (%)": f"{result['results']['overall_score']:.1f}%",
+                "Compliance Level": result["results"]["compliance_level"],
+                "Rejected Answers": len(result["rejects"])
+            })
+
+    st.success(f"Imported {len(imported)} questionnaires.")
+    if imported:
+        st.dataframe(pd.DataFrame(imported), use_container_width=True)
+
+    st.subheader("Reject Report")
+    if rejects:
+        reject_df = pd.DataFrame(rejects)
+        st.dataframe(reject_df, use_container_width=True)
+        st.download_button("Download Reject Report", reject_df.to_csv(index=False),
+                           file_name="reject_report.csv", mime="text/csv")
+    else:
+        st.write("All answers were recognized.")
+
+# Duplicate submissions page
+def render_duplicates():
+    st.header("Near-Duplicate Submissions")
+    st.write("Groups of stored assessments whose answers are nearly identical, which may indicate copied template answers.")
+
+    threshold = st.slider("Minimum answer similarity", min_value=DUPLICATE_MIN_THRESHOLD, max_value=1.0,
+                          value=DUPLICATE_THRESHOLD, step=0.05)
+    clusters = get_assessment_store().find_duplicate_clusters(threshold)
+    if not clusters:
+        st.info("No near-duplicate submissions found.")
+        return
+
+    st.write(f"Found {len(clusters)} groups of near-duplicate submissions.")
+    for i, cluster in enumerate(clusters):
+        organizations = sorted({member["Organization"] for member in cluster})
+        with st.expander(f"Group {i + 1}: {len(cluster)} submissions from {len(organizations)} organizations"):
+            df = pd.DataFrame(cluster)
+            df["Similarity"] = df["Similarity"].map(lambda x: f"{x * 100:.0f}%")
+            st.dataframe(df, use_container_width=True)
+
+# Portfolio insights page
+def render_portfolio():
+    st.header("Portfolio Insights")
+    store = get_assessment_store()
+    ranking = portfolio_attribution(store)
+    if not ranking["Total Points Lost"].any():
+        st.info("No stored assessments yet.")
+        return
+
+    st.subheader("Questions Costing the Most Points")
+    display = ranking.copy()
+    display["Avg Points Lost"] = display["Avg Points Lost"].map(lambda x: f"{x:.2f}")
+    display["Total Points Lost"] = display["Total Points Lost"].map(lambda x: f"{x:,.1f}")
+    st.dataframe(display, use_container_width=True)
+
+    st.subheader("Score Attribution by Organization")
+    arrays = store.model_arrays(store.active_model_version())
+    latest = {organization: codes for organization, _, _, codes in store.latest_assessments()}
+    organization = st.selectbox("Organization", sorted(latest, key=str.lower))
+    if organization:
+        _, contributions = score_attribution(latest[organization], arrays)
+        st.plotly_chart(attribution_waterfall(contributions[0]), use_container_width=True)
+
+    st.subheader("Remediation Plans")
+    budget = st.slider("Effort budget per organization (person-weeks)", min_value=1, max_value=60, value=12)
+    plans = portfolio_remediation(latest, budget, arrays)
+
+    # Every organization is planned; only the table is shown a page at a time
+    page_size = 25
+    state = page_state("portfolio_plans", budget)
+    offset = state["cursors"][-1] or 0
+    next_offset = offset + page_size if offset + page_size < len(plans) else None
+    st.dataframe(plans.iloc[offset:offset + page_size].round(1), use_container_width=True, hide_index=True)
+    render_page_controls("portfolio_plans", state, next_offset)
+
+# Static report publishing page
+def render_publish():
+    st.header("Publish HTML Reports")
+    st.write("Generate a self-contained HTML report for every organization's latest assessment. "
+             "Reports whose content has not changed since the last build are skipped.")
+
+    output_dir = st.text_input("Output folder", value=REPORT_OUTPUT_DIR)
+    if st.button("Build Reports", type="primary"):
+        with st.spinner("Building reports..."):
+            summary = build_html_reports(get_assessment_store(), output_dir)
+        record_audit_event("reports_published", None, {"output_dir": output_dir, **summary})
+        st.success(f"Wrote {summary['written']} reports, skipped {summary['skipped']} unchanged reports.")
+
+# Scoring model page
+def render_scoring_model():
+    st.header("Scoring Model")
+    store = get_assessment_store()
+    active_version = store.active_model_version()
+    st.write(f"**Active model version:** {active_version}")
+    st.write(f"**Model version in this release:** {store.code_model_version}")
+
+    if active_version == store.code_model_version:
+        st.success("Stored results are up to date with the current section weights and answer points.")
+        return
+
+    changed_pairs, changed_weights = scoring_model_changes(
+        store.model_arrays(active_version), store.model_arrays(store.code_model_version)
+    )
+    st.warning("Section weights or answer points have changed since stored results were scored.")
+    if len(changed_weights):
+        st.write("**Sections with changed weights:** " + ", ".join(sections[i]["name"] for i in changed_weights))
+    if len(changed_pairs):
+        st.write("**Questions with changed answer points:** " + ", ".join(
+            sorted({question_labels[question] for question, _ in changed_pairs})
+        ))
+
+    if st.button("Rescore Assessments", type="primary"):
+        progress_bar = st.progress(0.0)
+        summary = store.rescore(
+            current_scoring_model(),
+            progress=lambda done, total: progress_bar.progress(done / total if total else 1.0)
+        )
+        record_audit_event("scoring_model_activated", None, {
+            "previous_version": active_version, **summary
+        })
+        st.success(f"Switched to model {summary['version']}: rescored {summary['rescored']} assessments, "
+                   f"reused {summary['copied']} unchanged results.")
+
+# Audit log page
+def render_audit_log():
+    st.header("Audit Log")
+    st.write(f"Log file: `{AUDIT_LOG_PATH}`")
+    st.write("Verify that no recorded event has been edited, removed or reordered since it was written.")
+
+    if st.button("Verify Audit Log", type="primary"):
+        # Make sure events queued by this process are included
+        try:
+            get_audit_log().flush(timeout=30)
+        except AuditLogError as e:
+            st.error(f"Audit log: {e}")
+        with st.spinner("Verifying hash chain..."):
+            is_valid, records_checked, bad_line, last_hash = verify_audit_log(AUDIT_LOG_PATH)
+        if is_valid:
+            st.success(f"Hash chain intact: {records_checked:,} records verified.")
+        else:
+            st.error(f"Hash chain broken at line {bad_line:,} after {records_checked:,} valid records.")
+        st.write(f"**Last valid hash:** `{last_hash}`")
+        st.caption("Record the last hash somewhere outside this server to also detect truncation of the log.")
+
 # Main app logic
 def main():
     # Render header
@@ -889,6 +2986,22 @@ def main():
         render_report()
     elif st.session_state.current_page == 'recommendations':
         render_recommendations()
+    elif st.session_state.current_page == 'assessments':
+        render_assessment_list()
+    elif st.session_state.current_page == 'search':
+        render_search()
+    elif st.session_state.current_page == 'import':
+        render_import()
+    elif st.session_state.current_page == 'duplicates':
+        render_duplicates()
+    elif st.session_state.current_page == 'portfolio':
+        render_portfolio()
+    elif st.session_state.current_page == 'publish':
+        render_publish()
+    elif st.session_state.current_page == 'scoring_model':
+        render_scoring_model()
+    elif st.session_state.current_page == 'audit_log':
+        render_audit_log()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file